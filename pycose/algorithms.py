@@ -1,9 +1,9 @@
-from hashlib import sha512, sha384, sha256
 from typing import Any, Optional, NamedTuple, List
 
 from aenum import MultiValue, Enum, skip
 from cryptography.hazmat.primitives import keywrap
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM, AESCCM
+from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, SECP384R1, SECP521R1
 from cryptography.hazmat.primitives.ciphers.algorithms import AES
 from cryptography.hazmat.primitives.hashes import SHA384, SHA256, SHA512
 from cryptography.hazmat.primitives.hmac import HMAC
@@ -17,14 +17,16 @@ class _AlgorithmConfig(NamedTuple):
     curve: Any = None
     tag_length: Optional[int] = None
     hash: Any = None
+    kind: Optional[str] = None
+    ecdsa_curve: Any = None
 
 
 class CoseAlgorithms(Enum):
     _init_ = 'id fullname config'
     _settings_ = MultiValue
 
-    ES512 = -36, 'ES512', skip(_AlgorithmConfig(curve=NIST521p, hash=sha512))
-    ES384 = -35, 'ES384', skip(_AlgorithmConfig(curve=NIST384p, hash=sha384))
+    ES512 = -36, 'ES512', skip(_AlgorithmConfig(curve=SECP521R1, hash=SHA512, ecdsa_curve=NIST521p))
+    ES384 = -35, 'ES384', skip(_AlgorithmConfig(curve=SECP384R1, hash=SHA384, ecdsa_curve=NIST384p))
     ECDH_SS_A256KW = -34, 'ECDH_SS_A256KW', skip(_AlgorithmConfig(primitive=keywrap, kdf=HKDF, hash=SHA256))
     ECDH_SS_A192KW = -33, 'ECDH_SS_A192KW', skip(_AlgorithmConfig(primitive=keywrap, kdf=HKDF, hash=SHA256))
     ECDH_SS_A128KW = -32, 'ECDH_SS_A128KW', skip(_AlgorithmConfig(primitive=keywrap, kdf=HKDF, hash=SHA256))
@@ -45,31 +47,31 @@ class CoseAlgorithms(Enum):
     DIRECT_HKDF_SHA_512 = -11, 'DIRECT_HKDF_SHA_512', skip(_AlgorithmConfig(kdf=HKDF, hash=SHA512))
     DIRECT_HKDF_SHA_256 = -10, 'DIRECT_HKDF_SHA_256', skip(_AlgorithmConfig(kdf=HKDF, hash=SHA256))
     EDDSA = -8, 'EdDSA', skip(_AlgorithmConfig(hash=SHA256))
-    ES256 = -7, 'ES256', skip(_AlgorithmConfig(curve=NIST256p, hash=sha256))
-    DIRECT = -6, 'Direct', skip(_AlgorithmConfig())
-    A256KW = -5, 'A256KW', skip(_AlgorithmConfig(primitive=keywrap))
-    A192KW = -4, 'A192KW', skip(_AlgorithmConfig(primitive=keywrap))
-    A128KW = -3, 'A128KW', skip(_AlgorithmConfig(primitive=keywrap))
-    A128GCM = 1, 'A128GCM', skip(_AlgorithmConfig(primitive=AESGCM))
-    A192GCM = 2, 'A192GCM', skip(_AlgorithmConfig(primitive=AESGCM))
-    A256GCM = 3, 'A256GCM', skip(_AlgorithmConfig(primitive=AESGCM))
-    HMAC_256_64 = 4, 'HMAC_256_64', skip(_AlgorithmConfig(primitive=HMAC, tag_length=8, hash=SHA256))
-    HMAC_256_256 = 5, 'HMAC_256_256', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA256))
-    HMAC_384_384 = 6, 'HMAC_256_384', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA384))
-    HMAC_512_512 = 7, 'HMAC_256_512', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA512))
-    AES_CCM_16_64_128 = 10, 'AES_CCM_16_64_128', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8))
-    AES_CCM_16_64_256 = 11, 'AES_CCM_16_64_256', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8))
-    AES_CCM_64_64_128 = 12, 'AES_CCM_64_64_128', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8))
-    AES_CCM_64_64_256 = 13, 'AES_CCM_64_64_256', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8))
-    AES_MAC_128_64 = 14, 'AES_MAC_128_64', skip(_AlgorithmConfig(primitive=AES, tag_length=8))
-    AES_MAC_256_64 = 15, 'AES_MAC_256_64', skip(_AlgorithmConfig(primitive=AES, tag_length=8))
+    ES256 = -7, 'ES256', skip(_AlgorithmConfig(curve=SECP256R1, hash=SHA256, ecdsa_curve=NIST256p))
+    DIRECT = -6, 'Direct', skip(_AlgorithmConfig(kind='direct'))
+    A256KW = -5, 'A256KW', skip(_AlgorithmConfig(primitive=keywrap, kind='keywrap'))
+    A192KW = -4, 'A192KW', skip(_AlgorithmConfig(primitive=keywrap, kind='keywrap'))
+    A128KW = -3, 'A128KW', skip(_AlgorithmConfig(primitive=keywrap, kind='keywrap'))
+    A128GCM = 1, 'A128GCM', skip(_AlgorithmConfig(primitive=AESGCM, kind='aead'))
+    A192GCM = 2, 'A192GCM', skip(_AlgorithmConfig(primitive=AESGCM, kind='aead'))
+    A256GCM = 3, 'A256GCM', skip(_AlgorithmConfig(primitive=AESGCM, kind='aead'))
+    HMAC_256_64 = 4, 'HMAC_256_64', skip(_AlgorithmConfig(primitive=HMAC, tag_length=8, hash=SHA256, kind='hmac'))
+    HMAC_256_256 = 5, 'HMAC_256_256', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA256, kind='hmac'))
+    HMAC_384_384 = 6, 'HMAC_256_384', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA384, kind='hmac'))
+    HMAC_512_512 = 7, 'HMAC_256_512', skip(_AlgorithmConfig(primitive=HMAC, hash=SHA512, kind='hmac'))
+    AES_CCM_16_64_128 = 10, 'AES_CCM_16_64_128', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8, kind='aead'))
+    AES_CCM_16_64_256 = 11, 'AES_CCM_16_64_256', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8, kind='aead'))
+    AES_CCM_64_64_128 = 12, 'AES_CCM_64_64_128', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8, kind='aead'))
+    AES_CCM_64_64_256 = 13, 'AES_CCM_64_64_256', skip(_AlgorithmConfig(primitive=AESCCM, tag_length=8, kind='aead'))
+    AES_MAC_128_64 = 14, 'AES_MAC_128_64', skip(_AlgorithmConfig(primitive=AES, tag_length=8, kind='cbc-mac'))
+    AES_MAC_256_64 = 15, 'AES_MAC_256_64', skip(_AlgorithmConfig(primitive=AES, tag_length=8, kind='cbc-mac'))
     # # CHACHA20_POLY1305 = 24
-    AES_MAC_128_128 = 25, 'AES_MAC_128_128', skip(_AlgorithmConfig(primitive=AES))
-    AES_MAC_256_128 = 26, 'AES_MAC_256_128', skip(_AlgorithmConfig(primitive=AES))
-    AES_CCM_16_128_128 = 30, 'AES_CCM_16_128_128', skip(_AlgorithmConfig(primitive=AESCCM))
-    AES_CCM_16_128_256 = 31, 'AES_CCM_16_128_256', skip(_AlgorithmConfig(primitive=AESCCM))
-    AES_CCM_64_128_128 = 32, 'AES_CCM_64_128_128', skip(_AlgorithmConfig(primitive=AESCCM))
-    AES_CCM_64_128_256 = 33, 'AES_CCM_64_128_256', skip(_AlgorithmConfig(primitive=AESCCM))
+    AES_MAC_128_128 = 25, 'AES_MAC_128_128', skip(_AlgorithmConfig(primitive=AES, kind='cbc-mac'))
+    AES_MAC_256_128 = 26, 'AES_MAC_256_128', skip(_AlgorithmConfig(primitive=AES, kind='cbc-mac'))
+    AES_CCM_16_128_128 = 30, 'AES_CCM_16_128_128', skip(_AlgorithmConfig(primitive=AESCCM, kind='aead'))
+    AES_CCM_16_128_256 = 31, 'AES_CCM_16_128_256', skip(_AlgorithmConfig(primitive=AESCCM, kind='aead'))
+    AES_CCM_64_128_128 = 32, 'AES_CCM_64_128_128', skip(_AlgorithmConfig(primitive=AESCCM, kind='aead'))
+    AES_CCM_64_128_256 = 33, 'AES_CCM_64_128_256', skip(_AlgorithmConfig(primitive=AESCCM, kind='aead'))
 
     def __int__(self):
         return self.id
@@ -83,6 +85,9 @@ class CoseAlgorithms(Enum):
     def __eq__(self, other):
         return self.id == other or self.fullname == other
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
     def __hash__(self):
         return hash(self.id)
 
@@ -1,5 +1,6 @@
 import abc
 from enum import IntEnum, unique
+from functools import lru_cache
 from typing import Optional
 
 import cbor2
@@ -37,6 +38,26 @@ class CoseHeaderKeys(IntEnum):
     PARTY_V_OTHER = -26
 
 
+def _canonical_header(header: dict) -> Optional[tuple]:
+    """
+    Hashable form of a header that preserves the item order. The types are part of the key so that values which compare
+    equal but encode differently (e.g. 1 and True) never share an encoding. Returns None for non-scalar headers.
+    """
+
+    canonical = []
+    for k, v in header.items():
+        if not isinstance(k, (int, str)) or not isinstance(v, (int, str, bytes)):
+            return None
+        canonical.append((type(k), k, type(v), v))
+
+    return tuple(canonical)
+
+
+@lru_cache(maxsize=1024)
+def _encode_header(canonical: tuple) -> bytes:
+    return cbor2.dumps({k: v for _, k, _, v in canonical})
+
+
 class CoseBase(metaclass=abc.ABCMeta):
     """ Basic COSE information buckets. """
 
@@ -106,12 +127,17 @@ class CoseBase(metaclass=abc.ABCMeta):
         self._uhdr.update(uhdr_params)
 
     def encode_phdr(self) -> bytes:
-        """ Encode the protected header. """
+        """ Encode the protected header. Encodings are shared between headers with identical contents. """
 
         if len(self._phdr):
             if CoseHeaderKeys.ALG in self._phdr:
                 self._phdr[CoseHeaderKeys.ALG] = int(self._phdr[CoseHeaderKeys.ALG])
-            return cbor2.dumps(self._phdr)
+
+            canonical = _canonical_header(self._phdr)
+            if canonical is None:
+                return cbor2.dumps(self._phdr)
+
+            return _encode_header(canonical)
         else:
             return b''
 
@@ -1,9 +1,8 @@
 import base64
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum, unique
-from typing import List, Union, Dict, Optional, TypeVar, TYPE_CHECKING, Type, Callable
+from typing import List, Union, Dict, Optional, TypeVar, TYPE_CHECKING, Type, Callable, ClassVar
 
-import dataclasses
 from dataclasses import dataclass
 
 from pycose.algorithms import CoseAlgorithms
@@ -59,13 +58,19 @@ class EllipticCurveType(IntEnum):
 class CoseKey(metaclass=ABCMeta):
     """ Abstract base class for all key type in COSE. """
 
+    __slots__ = ('_kty', '_kid', '_alg', '_key_ops', '_base_iv')
+
     _kty: Optional[KTY]
     _kid: Optional[Union[int, bytes]]
     _alg: Optional[CoseAlgorithms]
     _key_ops: Optional[KeyOps]
     _base_iv: Optional[bytes]
 
-    _KTY = {}
+    # COSE key types, indexed by their KTY identifier
+    _KTY: ClassVar[List[Optional[Type['CoseKey']]]] = [None] * 16
+
+    # set on key types that carry a 'crv' parameter
+    _HAS_CRV: ClassVar[bool] = False
 
     class Common(IntEnum):
         """ Common COSE key parameters. """
@@ -75,6 +80,9 @@ class CoseKey(metaclass=ABCMeta):
         KEY_OPS = 4
         BASE_IV = 5
 
+    # maps attribute names to their COSE key parameter labels
+    _PARAM_MAP = {name.lower(): member for name, member in Common.__members__.items()}
+
     def __init__(self, kty, kid, alg, key_ops, base_iv):
         self.kty = kty
         self.kid = kid
@@ -108,38 +116,32 @@ class CoseKey(metaclass=ABCMeta):
         :param received: Dictionary must contain the KTY element otherwise the key object cannot be decoded properly.
         :raises KeyError: Decoding function fails when KTY parameter is not found or has an invalid value.
         """
-        try:
-            return cls._KTY[received[cls.Common.KTY]].from_cose_key_obj(received)
-        except KeyError as e:
-            raise KeyError("Key type identifier is not recognized", e)
+        kty = received.get(cls.Common.KTY)
+        key_type = cls._KTY[kty] if isinstance(kty, int) and 0 <= kty < len(cls._KTY) else None
+
+        if key_type is None:
+            raise KeyError("Key type identifier is not recognized", kty)
+
+        return key_type.from_cose_key_obj(received)
 
     @staticmethod
     def base64decode(to_decode: str) -> bytes:
         """
-        Decodes BASE64 encoded keys to bytes.
+        Decodes BASE64 encoded keys to bytes. Accepts both the URL-safe and the standard alphabet, with or without
+        padding.
         :param to_decode: base64 encoded key.
         :return: key as bytes.
         """
-        to_decode = to_decode.replace('-', '+')
-        to_decode = to_decode.replace('_', '/')
-
-        if len(to_decode) % 4 == 0:
-            return base64.b64decode(to_decode)
-        if len(to_decode) % 4 == 2:
-            to_decode = to_decode + "=="
-            return base64.b64decode(to_decode)
-        if len(to_decode) % 4 == 3:
-            to_decode = to_decode + "="
-            return base64.b64decode(to_decode)
+        return base64.urlsafe_b64decode(to_decode + "=" * (-len(to_decode) % 4))
 
     @staticmethod
     def base64encode(to_encode: bytes) -> str:
         """
-        Encodes key bytes as a string.
+        Encodes key bytes as an unpadded URL-safe BASE64 string, the inverse of 'base64decode'.
         :param to_encode: bytes
         :return: base64 encoding.
         """
-        return base64.b64encode(to_encode).decode("utf-8")
+        return base64.urlsafe_b64encode(to_encode).rstrip(b"=").decode("ascii")
 
     @property
     def kty(self) -> KTY:
@@ -147,8 +149,8 @@ class CoseKey(metaclass=ABCMeta):
 
     @kty.setter
     def kty(self, new_kty: KTY) -> None:
-        _ = KTY(new_kty)  # check if the new value is a known COSE KTY, should never be None!
-        self._kty = new_kty
+        # check if the new value is a known COSE KTY, should never be None!
+        self._kty = new_kty if type(new_kty) is KTY else KTY(new_kty)
 
     @property
     def alg(self) -> Optional[CoseAlgorithms]:
@@ -156,11 +158,11 @@ class CoseKey(metaclass=ABCMeta):
 
     @alg.setter
     def alg(self, new_alg: CoseAlgorithms) -> None:
-        if new_alg is not None:
-            _ = CoseAlgorithms(new_alg)  # check if the new value is a known COSE Algorithm
-            self._alg = CoseAlgorithms(new_alg)
+        if new_alg is None or type(new_alg) is CoseAlgorithms:
+            self._alg = new_alg
         else:
-            self._alg = None
+            # check if the new value is a known COSE Algorithm
+            self._alg = CoseAlgorithms(new_alg)
 
     @property
     def kid(self) -> Optional[bytes]:
@@ -178,9 +180,11 @@ class CoseKey(metaclass=ABCMeta):
 
     @key_ops.setter
     def key_ops(self, new_key_ops: Optional[KeyOps]) -> None:
-        if new_key_ops is not None:
-            _ = KeyOps(new_key_ops)  # check if the new value is a known COSE key operation
-        self._key_ops = new_key_ops
+        if new_key_ops is None or type(new_key_ops) is KeyOps:
+            self._key_ops = new_key_ops
+        else:
+            # check if the new value is a known COSE key operation
+            self._key_ops = KeyOps(new_key_ops)
 
     @property
     def base_iv(self) -> Optional[bytes]:
@@ -193,13 +197,17 @@ class CoseKey(metaclass=ABCMeta):
         self._base_iv = new_base_iv
 
     def encode(self, *argv) -> Dict[int, Union[int, bytes]]:
-        key_words = ["_kty"]
+        """ Encodes specified attributes of the COSE Key object as a dictionary. """
+
+        encoded = {self.Common.KTY: self._kty}
 
         for kw in argv:
-            if kw.upper() in self.Common.__members__:
-                key_words.append(kw)
+            kw = kw.lower()
+            label = self._PARAM_MAP.get(kw)
+            if label is not None:
+                encoded[label] = getattr(self, '_' + kw)
 
-        return {self.Common[kw[1:].upper()]: dataclasses.asdict(self)[kw] for kw in key_words}
+        return encoded
 
     def _check_key_conf(self,
                         algorithm: CoseAlgorithms,
@@ -208,45 +216,45 @@ class CoseKey(metaclass=ABCMeta):
                         curve: Optional[EllipticCurveType] = None):
         """ Helper function that checks the configuration of the COSE key object. """
 
-        if self.alg is not None and algorithm is not None and CoseAlgorithms(self.alg) != CoseAlgorithms(algorithm):
-            raise ValueError("COSE key algorithm does not match with parameter 'algorithm'.")
-
         if algorithm is not None:
-            self.alg = algorithm
-
-        if self.alg is None:
+            if self._alg is None:
+                self.alg = algorithm
+            elif self._alg != algorithm:
+                raise ValueError("COSE key algorithm does not match with parameter 'algorithm'.")
+        elif self._alg is None:
             raise ValueError("Selected COSE algorithm cannot be 'None'")
 
         if peer_key is not None:
-            if peer_key.alg is not None and self.alg != peer_key.alg:
+            if peer_key._alg is not None and self._alg != peer_key._alg:
                 raise ValueError("Algorithms for private and public key do not match")
             else:
-                peer_key.alg = self.alg
-
-        if hasattr(self, "crv"):
-            if self.crv is not None and curve is not None and self.crv != curve:
-                raise ValueError("Curve in COSE key clashes with parameter 'curve'.")
+                peer_key._alg = self._alg
 
+        if self._HAS_CRV:
             if curve is not None:
-                self.crv = curve
+                if self._crv is None:
+                    self.crv = curve
+                elif self._crv != curve:
+                    raise ValueError("Curve in COSE key clashes with parameter 'curve'.")
 
-        if peer_key is not None:
-            if peer_key.crv is not None and self.crv != peer_key.crv:
-                raise ValueError("Curve parameter for private and public key do not match")
-            else:
-                peer_key.crv = self.crv
-
-        if self.key_ops is not None and key_operation is not None and self.key_ops != key_operation:
-            raise CoseIllegalKeyOps(f"COSE key operation should be {key_operation.name}, instead {self.key_ops.name}")
+            if peer_key is not None:
+                if peer_key._crv is not None and self._crv != peer_key._crv:
+                    raise ValueError("Curve parameter for private and public key do not match")
+                else:
+                    peer_key._crv = self._crv
 
         if key_operation is not None:
-            self.key_ops = key_operation
+            if self._key_ops is not None and self._key_ops != key_operation:
+                raise CoseIllegalKeyOps(
+                    f"COSE key operation should be {key_operation.name}, instead {self._key_ops.name}")
+
+            self._key_ops = key_operation
 
         if peer_key is not None:
-            if peer_key.key_ops is not None and self.key_ops != peer_key.key_ops:
+            if peer_key._key_ops is not None and self._key_ops != peer_key._key_ops:
                 raise ValueError("Key operation for private and public key do not match")
             else:
-                peer_key.key_ops = self.key_ops
+                peer_key._key_ops = self._key_ops
 
     @abstractmethod
     def __repr__(self):
@@ -1,28 +1,34 @@
+import hashlib
 from binascii import hexlify
 from enum import IntEnum
 from typing import Optional, Tuple
 
 import dataclasses
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, SECP384R1, SECP521R1, ECDH
+from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, SECP384R1, SECP521R1, ECDH, ECDSA
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
 from dataclasses import dataclass
-from ecdsa import SigningKey, VerifyingKey
-from ecdsa.ellipticcurve import Point
+from ecdsa import SigningKey
 
 from pycose.algorithms import CoseAlgorithms, config
 from pycose.context import CoseKDFContext
 from pycose.exceptions import CoseIllegalCurve, CoseInvalidAlgorithm
 from pycose.keys.cosekey import CoseKey, KTY, EllipticCurveType, KeyOps
 
+_BACKEND = default_backend()
+
 
 @CoseKey.record_kty(KTY.EC2)
 @dataclass(init=False)
 class EC2(CoseKey):
-    _crv: Optional[EllipticCurveType] = None
-    _x: Optional[bytes] = None
-    _y: Optional[bytes] = None
-    _d: Optional[bytes] = None
+    __slots__ = ('_crv', '_x', '_y', '_d')
+
+    _crv: Optional[EllipticCurveType]
+    _x: Optional[bytes]
+    _y: Optional[bytes]
+    _d: Optional[bytes]
 
     class EC2Prm(IntEnum):
         """ EC2 COSE key parameters. """
@@ -31,6 +37,10 @@ class EC2(CoseKey):
         Y = -3
         D = -4
 
+    _PARAM_MAP = {**CoseKey._PARAM_MAP, **{name.lower(): member for name, member in EC2Prm.__members__.items()}}
+
+    _HAS_CRV = True
+
     KEY_DERIVATION_CURVES = {
         EllipticCurveType.P_256: SECP256R1,
         EllipticCurveType.P_384: SECP384R1,
@@ -114,16 +124,6 @@ class EC2(CoseKey):
             raise ValueError("private key must be of type 'bytes'")
         self._d = new_d
 
-    def encode(self, *argv):
-        """ Encodes specified attributes of the COSE Key object as a dictionary. """
-        kws = []
-
-        for kw in argv:
-            if kw.upper() in self.EC2Prm.__members__:
-                kws.append('_' + kw)
-
-        return {**super().encode(*argv), **{self.EC2Prm[kw[1:].upper()]: dataclasses.asdict(self)[kw] for kw in kws}}
-
     def ecdh_key_derivation(self,
                             public_key: 'EC2',
                             context: CoseKDFContext,
@@ -151,19 +151,16 @@ class EC2(CoseKey):
         except KeyError:
             raise CoseIllegalCurve(curve)
 
-        d = ec.derive_private_key(int(hexlify(self.d), 16), curve, default_backend())
-        p = ec.EllipticCurvePublicNumbers(int(hexlify(public_key.x), 16), int(hexlify(public_key.y), 16), curve)
-        p = p.public_key(default_backend())
+        d = ec.derive_private_key(int.from_bytes(self.d, 'big'), curve, _BACKEND)
+        p = ec.EllipticCurvePublicKey.from_encoded_point(curve, b'\x04' + public_key.x + public_key.y)
 
         shared_key = d.exchange(ECDH(), p)
 
-        derived_key = alg_cfg.kdf(algorithm=alg_cfg.hash(),
-                                  length=int(context.supp_pub_info.key_data_length / 8),
-                                  salt=None,
-                                  info=context.encode(),
-                                  backend=default_backend()).derive(shared_key)
-
-        return shared_key, derived_key
+        return shared_key, alg_cfg.kdf(algorithm=alg_cfg.hash(),
+                                       length=int(context.supp_pub_info.key_data_length / 8),
+                                       salt=None,
+                                       info=context.encode(),
+                                       backend=_BACKEND).derive(shared_key)
 
     def sign(self,
              to_be_signed: bytes,
@@ -180,14 +177,14 @@ class EC2(CoseKey):
 
         self._check_key_conf(algorithm=alg, key_operation=KeyOps.SIGN, curve=curve)
 
-        try:
-            alg_cfg = config(CoseAlgorithms(self.alg))
-        except KeyError as err:
-            raise CoseInvalidAlgorithm(err)
+        alg_cfg = config(self.alg)
+        if alg_cfg.ecdsa_curve is None:
+            raise CoseInvalidAlgorithm(f"Not a valid ECDSA algorithm: {self.alg}")
 
-        sk = SigningKey.from_secret_exponent(int(hexlify(self.d), 16), curve=alg_cfg.curve)
+        # pyca/cryptography has no deterministic ECDSA (RFC 6979), python-ecdsa signs with its own curve and hashlib
+        sk = SigningKey.from_secret_exponent(int(hexlify(self.d), 16), curve=alg_cfg.ecdsa_curve)
 
-        return sk.sign_deterministic(to_be_signed, hashfunc=alg_cfg.hash)
+        return sk.sign_deterministic(to_be_signed, hashfunc=getattr(hashlib, alg_cfg.hash.name))
 
     def verify(self,
                to_be_signed: bytes,
@@ -202,19 +199,27 @@ class EC2(CoseKey):
         :param signature: signature to verify
         :param alg: an optional algorithm parameter (specifies the exact algorithm used for the signature).
         :param curve: an optional curve
+        :return: True if the signature is valid, otherwise cryptography.exceptions.InvalidSignature is raised
         """
 
         self._check_key_conf(algorithm=alg, key_operation=KeyOps.VERIFY, curve=curve)
 
-        try:
-            alg_cfg = config(CoseAlgorithms(self.alg))
-        except KeyError as err:
-            raise CoseInvalidAlgorithm(err)
+        alg_cfg = config(self.alg)
+        if alg_cfg.ecdsa_curve is None:
+            raise CoseInvalidAlgorithm(f"Not a valid ECDSA algorithm: {self.alg}")
+
+        curve_obj = alg_cfg.curve()
+        vk = ec.EllipticCurvePublicKey.from_encoded_point(curve_obj, b'\x04' + self.x + self.y)
+
+        # COSE signatures are the fixed-length concatenation r || s, pyca/cryptography expects DER
+        size = (curve_obj.key_size + 7) // 8
+        if len(signature) != 2 * size:
+            raise InvalidSignature(f"Invalid signature length, expected {2 * size} bytes, got {len(signature)}")
 
-        p = Point(curve=alg_cfg.curve.curve, x=int(hexlify(self.x), 16), y=int(hexlify(self.y), 16))
-        vk = VerifyingKey.from_public_point(p, alg_cfg.curve, alg_cfg.hash, validate_point=True)
+        der = encode_dss_signature(int.from_bytes(signature[:size], 'big'), int.from_bytes(signature[size:], 'big'))
 
-        return vk.verify(signature, to_be_signed)
+        vk.verify(der, to_be_signed, ECDSA(alg_cfg.hash()))
+        return True
 
     def __repr__(self):
         hdr = '<COSE_Key(EC2): {'
@@ -11,6 +11,8 @@ from pycose.context import CoseKDFContext
 from pycose.exceptions import CoseInvalidAlgorithm
 from pycose.keys.cosekey import CoseKey, KTY, EllipticCurveType, KeyOps
 
+_BACKEND = default_backend()
+
 
 @CoseKey.record_kty(KTY.OKP)
 @dataclass(init=False)
@@ -19,15 +21,21 @@ class OKP(CoseKey):
     Octet Key Pairs: Do not assume that keys using this type are elliptic curves.  This key type could be used for
     other curve types.
     """
-    _crv: Optional[EllipticCurveType] = None
-    _x: Optional[bytes] = None
-    _d: Optional[bytes] = None
+    __slots__ = ('_crv', '_x', '_d')
+
+    _crv: Optional[EllipticCurveType]
+    _x: Optional[bytes]
+    _d: Optional[bytes]
 
     class OKPPrm(IntEnum):
         CRV = -1
         X = -2
         D = -4
 
+    _PARAM_MAP = {**CoseKey._PARAM_MAP, **{name.lower(): member for name, member in OKPPrm.__members__.items()}}
+
+    _HAS_CRV = True
+
     @classmethod
     def from_cose_key_obj(cls, cose_key_obj: dict) -> 'OKP':
         """ Returns an initialized COSE_Key object of type OKP."""
@@ -95,15 +103,6 @@ class OKP(CoseKey):
     def private_bytes(self) -> Optional[bytes]:
         return self.d
 
-    def encode(self, *argv):
-        kws = []
-
-        for kw in argv:
-            if kw.upper() in self.OKPPrm.__members__:
-                kws.append('_' + kw)
-
-        return {**super().encode(*argv), **{self.OKPPrm[kw[1:].upper()]: dataclasses.asdict(self)[kw] for kw in kws}}
-
     def x25519_key_derivation(self,
                               public_key: 'OKP',
                               context: CoseKDFContext = b'',
@@ -126,7 +125,7 @@ class OKP(CoseKey):
                                   length=int(context.supp_pub_info.key_data_length / 8),
                                   salt=None,
                                   info=context.encode(),
-                                  backend=default_backend()).derive(shared_secret)
+                                  backend=_BACKEND).derive(shared_secret)
 
         return shared_secret, derived_key
 
@@ -1,6 +1,6 @@
-from binascii import unhexlify
+import hmac
 from enum import IntEnum
-from typing import Optional, Union
+from typing import Optional, Union, Tuple, Any
 
 import dataclasses
 from cryptography.hazmat.backends import default_backend
@@ -10,14 +10,55 @@ from dataclasses import dataclass
 
 from pycose.algorithms import CoseAlgorithms, config
 from pycose.context import CoseKDFContext
-from pycose.exceptions import CoseInvalidAlgorithm, CoseInvalidTag
+from pycose.exceptions import CoseInvalidAlgorithm, CoseInvalidTag, CoseIllegalKeyOps
 from pycose.keys.cosekey import CoseKey, KTY, KeyOps
 
+_BACKEND = default_backend()
+
+_CBC_MAC_IV = bytes(16)
+
+
+def _symmetric_entry(alg: CoseAlgorithms) -> Tuple[str, Any, Optional[int]]:
+    """ Returns the (kind, primitive, tag length) dispatch entry of a symmetric algorithm from its configuration. """
+
+    alg_cfg = config(alg)
+
+    # HMAC tags are computed with the stdlib hmac module, which takes hashlib digest names
+    primitive = alg_cfg.hash.name if alg_cfg.kind == 'hmac' else alg_cfg.primitive
+    return alg_cfg.kind, primitive, alg_cfg.tag_length
+
+
+_SYMMETRIC_ALGORITHMS = {alg: _symmetric_entry(alg) for alg in CoseAlgorithms if config(alg).kind is not None}
+
+# flattened into a tuple indexed by the algorithm identifier (shifted by the smallest identifier)
+_ALG_OFFSET = min(alg.id for alg in _SYMMETRIC_ALGORITHMS)
+_ALG_TABLE = tuple(
+    _SYMMETRIC_ALGORITHMS.get(i) for i in range(_ALG_OFFSET, max(alg.id for alg in _SYMMETRIC_ALGORITHMS) + 1))
+
+_MAC_KINDS = ('hmac', 'cbc-mac')
+
+
+def _alg_entry(alg: CoseAlgorithms) -> Optional[Tuple[str, Any, Optional[int]]]:
+    """ Returns the (kind, primitive, tag length) entry for the algorithm, or None if it is not a symmetric one. """
+
+    index = alg.id - _ALG_OFFSET
+    return _ALG_TABLE[index] if 0 <= index < len(_ALG_TABLE) else None
+
+
+def _check_session_key_ops(key: 'SymmetricKey', key_operation: KeyOps) -> None:
+    """ Checks the key operation of a session key without assigning it, a key without 'key_ops' allows both. """
+
+    if key.key_ops is not None and key.key_ops != key_operation:
+        raise CoseIllegalKeyOps(f"COSE key operation should be {key_operation.name}, instead {key.key_ops.name}")
+
 
 @CoseKey.record_kty(KTY.SYMMETRIC)
 @dataclass(init=False)
 class SymmetricKey(CoseKey):
-    _k: Optional[bytes] = None
+    # '_cipher' is not a dataclass field, it caches the AEAD cipher object built from 'k' and 'alg'
+    __slots__ = ('_k', '_cipher')
+
+    _k: Optional[bytes]
 
     class SymPrm(IntEnum):
         K = - 1
@@ -26,6 +67,8 @@ class SymmetricKey(CoseKey):
         def has_member(cls, item):
             return item in cls.__members__
 
+    _PARAM_MAP = {**CoseKey._PARAM_MAP, **{name.lower(): member for name, member in SymPrm.__members__.items()}}
+
     def __init__(self,
                  kid: Optional[bytes] = None,
                  alg: Optional[int] = None,
@@ -58,10 +101,12 @@ class SymmetricKey(CoseKey):
         if type(new_k) is not bytes and new_k is not None:
             raise ValueError("symmetric key must be of type 'bytes'")
         self._k = new_k
+        self._cipher = None
 
-    def encode(self, *argv):
-        kws = [kw for kw in argv if self.SymPrm.has_member(kw.upper())]
-        return {**super().encode(*argv), **{self.SymPrm[kw.upper()]: dataclasses.asdict(self)[kw] for kw in kws}}
+    @CoseKey.alg.setter
+    def alg(self, new_alg: CoseAlgorithms) -> None:
+        CoseKey.alg.fset(self, new_alg)
+        self._cipher = None
 
     def encrypt(self, plaintext: bytes, aad: bytes, nonce: bytes, alg: Optional[CoseAlgorithms]) -> bytes:
         self._check_key_conf(alg, KeyOps.ENCRYPT)
@@ -85,27 +130,31 @@ class SymmetricKey(CoseKey):
 
         return plaintext
 
-    def _prepare_cipher(self):
-        alg_cfg = config(CoseAlgorithms(self.alg))
+    def _prepare_cipher(self) -> Union[AESGCM, AESCCM]:
+        """ Returns the AEAD cipher object for this key, the expanded key schedule is reused across messages. """
 
-        if alg_cfg.tag_length is not None:
-            cipher: Union[AESGCM, AESCCM] = alg_cfg.primitive(self.k, tag_length=alg_cfg.tag_length)
-        else:
-            cipher = alg_cfg.primitive(self.k)
+        if self._cipher is None:
+            entry = _alg_entry(self.alg)
+            if entry is None or entry[0] != 'aead':
+                raise CoseInvalidAlgorithm(f"Not a valid AEAD algorithm: {self.alg}")
 
-        return cipher
+            _, primitive, tag_length = entry
+            if tag_length is not None:
+                self._cipher = primitive(self.k, tag_length=tag_length)
+            else:
+                self._cipher = primitive(self.k)
+
+        return self._cipher
 
     def key_wrap(self, plaintext_key: bytes, alg: Optional[CoseAlgorithms] = None) -> bytes:
         self._check_key_conf(alg, KeyOps.WRAP)
 
-        try:
-            alg_cfg = config(CoseAlgorithms(self.alg))
-        except KeyError as err:
-            raise CoseInvalidAlgorithm(err)
+        entry = _alg_entry(self.alg)
+        kind = None if entry is None else entry[0]
 
-        if self.alg in {CoseAlgorithms.A128KW, CoseAlgorithms.A192KW, CoseAlgorithms.A256KW}:
-            return alg_cfg.primitive.aes_key_wrap(self.k, plaintext_key, default_backend())
-        elif self.alg == CoseAlgorithms.DIRECT:
+        if kind == 'keywrap':
+            return entry[1].aes_key_wrap(self.k, plaintext_key, _BACKEND)
+        elif kind == 'direct':
             return b''
         else:
             raise CoseInvalidAlgorithm(f"Key wrap requires one of the following algorithms: \
@@ -114,65 +163,51 @@ class SymmetricKey(CoseKey):
     def key_unwrap(self, wrapped_key: bytes, alg: Optional[CoseAlgorithms] = None) -> bytes:
         self._check_key_conf(alg, KeyOps.UNWRAP)
 
-        try:
-            alg_cfg = config(CoseAlgorithms(self.alg))
-        except KeyError as err:
-            raise CoseInvalidAlgorithm(err)
+        entry = _alg_entry(self.alg)
+        if entry is None or entry[0] != 'keywrap':
+            raise CoseInvalidAlgorithm(f"Key unwrap requires one of the following algorithms: \
+            {(CoseAlgorithms.A256KW, CoseAlgorithms.A192KW, CoseAlgorithms.A128KW)}")
 
-        return alg_cfg.primitive.aes_key_unwrap(self.k, wrapped_key, default_backend())
+        return entry[1].aes_key_unwrap(self.k, wrapped_key, _BACKEND)
 
     def compute_tag(self, to_be_maced: bytes, alg: Optional[CoseAlgorithms] = None) -> bytes:
         """ Calculate the MAC over the payload """
 
         self._check_key_conf(alg, KeyOps.MAC_CREATE)
 
-        iv = unhexlify(b"".join([b"00"] * 16))
+        return self._mac(to_be_maced)
 
-        try:
-            alg_cfg = config(CoseAlgorithms(self.alg))
-        except KeyError as err:
-            raise CoseInvalidAlgorithm(err)
-
-        if self.alg in {CoseAlgorithms.AES_MAC_128_128,
-                        CoseAlgorithms.AES_MAC_128_64,
-                        CoseAlgorithms.AES_MAC_256_64,
-                        CoseAlgorithms.AES_MAC_256_128}:
-            encryptor = Cipher(alg_cfg.primitive(self.k), modes.CBC(iv), backend=default_backend()).encryptor()
-
-            while len(to_be_maced) % 16 != 0:
-                to_be_maced += unhexlify(b"00")
+    def verify_tag(self, tag: bytes, to_be_maced: bytes, alg: Optional[CoseAlgorithms] = None) -> bool:
+        """ Verify the MAC over the payload """
 
-            ciphertext = encryptor.update(to_be_maced) + encryptor.finalize()
+        self._check_key_conf(alg, KeyOps.MAC_VERIFY)
 
-            if alg_cfg.tag_length is not None:
-                # truncate the result to the first 64 bits
-                ciphertext = ciphertext[:-8]
-                digest = ciphertext[-8:]
-            else:
-                digest = ciphertext[-16:]
-        else:
-            h = alg_cfg.primitive(self.k, alg_cfg.hash(), backend=default_backend())
-            h.update(to_be_maced)
-            digest = h.finalize()
+        if not hmac.compare_digest(tag, self._mac(to_be_maced)):
+            raise CoseInvalidTag(f"Invalid authentication tag: {tag}")
+        return True
 
-            if CoseAlgorithms(self.alg) == CoseAlgorithms.HMAC_256_64:
-                # truncate the result to the first 64 bits
-                digest = digest[:8]
+    def _mac(self, to_be_maced: bytes) -> bytes:
+        entry = _alg_entry(self.alg)
+        if entry is None or entry[0] not in _MAC_KINDS:
+            raise CoseInvalidAlgorithm(f"Not a valid MAC algorithm: {self.alg}")
 
-        return digest
+        kind, primitive, tag_length = entry
 
-    def verify_tag(self, tag: bytes, to_be_maced: bytes, alg: Optional[CoseAlgorithms] = None) -> bool:
-        """ Verify the MAC over the payload """
+        if kind == 'cbc-mac':
+            encryptor = Cipher(primitive(self.k), modes.CBC(_CBC_MAC_IV), backend=_BACKEND).encryptor()
 
-        self._check_key_conf(alg, KeyOps.MAC_VERIFY)
+            # zero-pad to the block size (an empty input becomes one zero block), the tag is (a prefix of) the last
+            # ciphertext block
+            to_be_maced += bytes(-len(to_be_maced) % 16 if to_be_maced else 16)
+            digest = (encryptor.update(to_be_maced) + encryptor.finalize())[-16:]
+        else:
+            digest = hmac.new(self.k, to_be_maced, primitive).digest()
 
-        self.key_ops = KeyOps.MAC_CREATE
-        computed_tag = self.compute_tag(to_be_maced, alg)
-        self.key_ops = KeyOps.MAC_VERIFY
+        if tag_length is not None:
+            # truncate the result to the first 64 bits
+            digest = digest[:tag_length]
 
-        if tag != computed_tag:
-            raise CoseInvalidTag(f"Invalid authentication tag: {tag} != {computed_tag}")
-        return True
+        return digest
 
     def hmac_key_derivation(self,
                             context: CoseKDFContext,
@@ -190,7 +225,7 @@ class SymmetricKey(CoseKey):
                                   length=int(context.supp_pub_info.key_data_length / 8),
                                   salt=salt,
                                   info=context.encode(),
-                                  backend=default_backend()).derive(self.k)
+                                  backend=_BACKEND).derive(self.k)
 
         return derived_key
 
@@ -198,3 +233,75 @@ class SymmetricKey(CoseKey):
         hdr = '<COSE_Key(Symmetric): {'
         output = [f'{k[1:]}: {v}' for k, v in dataclasses.asdict(self).items() if v is not None]
         return hdr + ", ".join(output) + '}>'
+
+
+class MacSession:
+    """
+    Computes and verifies authentication tags for many messages under the same symmetric key. For HMAC algorithms the
+    key is absorbed once and every message starts from a copy of the keyed state.
+    """
+
+    def __init__(self, key: SymmetricKey, alg: Optional[CoseAlgorithms] = None):
+        key._check_key_conf(alg, None)
+
+        entry = _alg_entry(key.alg)
+        if entry is None or entry[0] not in _MAC_KINDS:
+            raise CoseInvalidAlgorithm(f"Not a valid MAC algorithm: {key.alg}")
+
+        kind, primitive, tag_length = entry
+
+        self._key = key
+        self._tag_length = tag_length
+        self._keyed = hmac.new(key.k, digestmod=primitive) if kind == 'hmac' else None
+
+    def compute_tag(self, to_be_maced: bytes) -> bytes:
+        """ Calculate the MAC over the payload """
+
+        _check_session_key_ops(self._key, KeyOps.MAC_CREATE)
+
+        return self._tag(to_be_maced)
+
+    def verify_tag(self, tag: bytes, to_be_maced: bytes) -> bool:
+        """ Verify the MAC over the payload """
+
+        _check_session_key_ops(self._key, KeyOps.MAC_VERIFY)
+
+        if not hmac.compare_digest(tag, self._tag(to_be_maced)):
+            raise CoseInvalidTag(f"Invalid authentication tag: {tag}")
+        return True
+
+    def _tag(self, to_be_maced: bytes) -> bytes:
+        if self._keyed is None:
+            return self._key._mac(to_be_maced)
+
+        h = self._keyed.copy()
+        h.update(to_be_maced)
+        digest = h.digest()
+
+        if self._tag_length is not None:
+            digest = digest[:self._tag_length]
+
+        return digest
+
+
+class AEADSession:
+    """
+    Encrypts and decrypts many messages under the same symmetric key (e.g. a CEK shared by several recipients). The AEAD
+    cipher, and with it the expanded AES key schedule, is set up once for the lifetime of the session.
+    """
+
+    def __init__(self, key: SymmetricKey, alg: Optional[CoseAlgorithms] = None):
+        key._check_key_conf(alg, None)
+
+        self._key = key
+        self._cipher = key._prepare_cipher()
+
+    def encrypt(self, plaintext: bytes, aad: bytes, nonce: bytes) -> bytes:
+        _check_session_key_ops(self._key, KeyOps.ENCRYPT)
+
+        return self._cipher.encrypt(nonce=nonce, data=plaintext, associated_data=aad)
+
+    def decrypt(self, ciphertext: bytes, aad: bytes, nonce: bytes) -> bytes:
+        _check_session_key_ops(self._key, KeyOps.DECRYPT)
+
+        return self._cipher.decrypt(nonce=nonce, data=ciphertext, associated_data=aad)
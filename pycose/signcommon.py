@@ -38,7 +38,7 @@ class SignCommon(cosebase.CoseBase, metaclass=abc.ABCMeta):
                          curve: Optional[EllipticCurveType] = None) -> bool:
         """
         Verifies the signature of a received message
-        :return: True or raises an exception
+        :return: True or raises an exception (cryptography.exceptions.InvalidSignature for an invalid signature)
         """
         self._sanitize_args(public_key, alg, curve)
 
@@ -1,4 +1,4 @@
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Optional, Union
 
 import cbor2
 from dataclasses import dataclass
@@ -9,9 +9,6 @@ from pycose.keys.cosekey import EllipticCurveType
 from pycose.keys.ec import EC2
 from pycose.keys.okp import OKP
 
-if TYPE_CHECKING:
-    pass
-
 
 @dataclass
 class SignerParams:
@@ -41,6 +38,9 @@ class CoseSignature(signcommon.SignCommon):
         self._parent_msg = None
         self.external_aad = external_aad
 
+        # (body_protected, CBOR encoded Sig_structure prefix)
+        self._cached_to_sign_prefix = None
+
     @property
     def signature(self):
         return self._signature
@@ -56,24 +56,28 @@ class CoseSignature(signcommon.SignCommon):
     def _sig_structure(self) -> bytes:
         """ Creates the internal sig_structure for a COSE_Signature """
 
-        _sig_structure = [
-            self.context,
-            self._parent_msg.encode_phdr(),
-            self.encode_phdr(),
-            self.external_aad,
-            self._parent_msg.payload
-        ]
+        return self.build_to_sign(self._parent_msg.encode_phdr(), self._parent_msg.payload)
+
+    def build_to_sign(self, body_protected: bytes, payload: bytes) -> bytes:
+        """
+        Builds the Sig_structure [context, body_protected, sign_protected, external_aad, payload]. The encoding of the
+        invariant prefix (context and body_protected) is reused across calls.
+        """
+
+        if self._cached_to_sign_prefix is None or self._cached_to_sign_prefix[0] != body_protected:
+            # CBOR array header for the five Sig_structure elements, followed by the first two elements
+            prefix = b'\x85' + cbor2.dumps(self.context) + cbor2.dumps(body_protected)
+            self._cached_to_sign_prefix = (body_protected, prefix)
 
-        return cbor2.dumps(_sig_structure)
+        # strip the array header of the encoded template, the remaining elements are appended to the prefix
+        tail = cbor2.dumps([self.encode_phdr(), self.external_aad, payload])
+        return self._cached_to_sign_prefix[1] + memoryview(tail)[1:]
 
     def encode(self, params: SignerParams) -> list:
+        message = [self.encode_phdr(), self.encode_uhdr()]
 
         if params.sign:
-            message = [self.encode_phdr(),
-                       self.encode_uhdr(),
-                       self.compute_signature(alg=params.alg, private_key=params.private_key, curve=params.curve)]
-        else:
-            message = [self.encode_phdr(), self.encode_uhdr()]
+            message.append(self.compute_signature(alg=params.alg, private_key=params.private_key, curve=params.curve))
 
         return message
 
@@ -129,3 +129,22 @@ def test_direct_phdr_creation(params, expected):
 def test_direct_uhdr_creation(params, expected):
     enc0_msg = Enc0Message(uhdr=params)
     assert enc0_msg.encode_uhdr() == expected
+
+
+@pytest.mark.parametrize("param1, param2, expected",
+                         [({1: 1}, {1: 10}, b'A1010A'), ({1: 10}, {4: b'11'}, b'A2010A04423131')],
+                         ids=['protected_header_modified_after_encoding_' + str(i) for i in range(2)])
+def test_modify_phdr_after_encoding(param1, param2, expected):
+    enc0_msg = Enc0Message(phdr=param1)
+    _ = enc0_msg.encode_phdr()
+
+    enc0_msg.phdr.update(param2)
+
+    assert enc0_msg.encode_phdr() == unhexlify(expected)
+
+
+@pytest.mark.parametrize("phdr1, phdr2",
+                         [({4: 1}, {4: True}), ({4: 1}, {4: 1.0}), ({1: 10, 4: b'11'}, {4: b'11', 1: 10})],
+                         ids=['protected_header_equal_but_distinct_' + str(i) for i in range(3)])
+def test_distinct_phdr_encodings(phdr1, phdr2):
+    assert Enc0Message(phdr=phdr1).encode_phdr() != Enc0Message(phdr=phdr2).encode_phdr()
@@ -1,12 +1,14 @@
 from binascii import unhexlify
+from cryptography.exceptions import InvalidSignature, InvalidTag
 
-from pytest import mark as m
+from pytest import mark as m, raises
 
 from pycose.algorithms import CoseAlgorithms
 from pycose.context import CoseKDFContext, PartyInfo, SuppPubInfo
+from pycose.exceptions import CoseInvalidTag, CoseInvalidAlgorithm, CoseIllegalKeyOps
 from pycose.keys.cosekey import EllipticCurveType, CoseKey, KTY, KeyOps
 from pycose.keys.ec import EC2
-from pycose.keys.symmetric import SymmetricKey
+from pycose.keys.symmetric import SymmetricKey, MacSession, AEADSession
 
 
 @m.parametrize("crv, x, y, expected",
@@ -41,6 +43,34 @@ def test_cosekey_create(crv, x, y, expected):
     assert sorted(key.encode('x', 'y', 'crv')) == sorted(expected)
 
 
+@m.parametrize("encoded, expected",
+               [
+                   ("hJtXIZ2uSN5kbQfbtTNWbg", unhexlify("849B57219DAE48DE646D07DBB533566E")),
+                   ("hJtXIZ2uSN5kbQfbtTNWbg==", unhexlify("849B57219DAE48DE646D07DBB533566E")),
+                   ("Dx4tPEtaaXiHlqW0w9Lh8B8uPUxbanmI", unhexlify("0F1E2D3C4B5A69788796A5B4C3D2E1F01F2E3D4C5B6A7988")),
+                   ("-_8", b"\xfb\xff"),
+                   ("+/8", b"\xfb\xff"),
+               ], ids=['test_base64decode_' + str(i) for i in range(5)])
+def test_cosekey_base64decode(encoded, expected):
+    assert CoseKey.base64decode(encoded) == expected
+
+
+@m.parametrize("to_encode, expected",
+               [
+                   (unhexlify("849B57219DAE48DE646D07DBB533566E"), "hJtXIZ2uSN5kbQfbtTNWbg"),
+                   (b"\xfb\xff", "-_8"),
+                   (b"", ""),
+               ], ids=['test_base64encode_' + str(i) for i in range(3)])
+def test_cosekey_base64encode(to_encode, expected):
+    assert CoseKey.base64encode(to_encode) == expected
+    assert CoseKey.base64decode(CoseKey.base64encode(to_encode)) == to_encode
+
+
+def test_cosekey_base64decode_invalid_length():
+    with raises(ValueError):
+        CoseKey.base64decode("hJtXI")
+
+
 @m.parametrize('encoded_key_obj',
                [
                    ({-1: 1,
@@ -55,6 +85,13 @@ def test_cosekey_decode(encoded_key_obj):
     assert key.crv == EllipticCurveType.P_256
 
 
+@m.parametrize('encoded_key_obj', [{-1: 1}, {1: 3, -1: 1}, {1: 42, -1: 1}, {1: -1, -1: 1}, {1: b'\x02', -1: 1}],
+               ids=['test_unknown_key_type_decoding_' + str(i) for i in range(5)])
+def test_cosekey_decode_unknown_kty(encoded_key_obj):
+    with raises(KeyError):
+        CoseKey.decode(encoded_key_obj)
+
+
 @m.parametrize("kid, alg, key_ops, base_iv, k, pl, aad, nonce, algo, ct",
                [("our-secret".encode('utf-8'),
                  CoseAlgorithms.AES_CCM_64_128_256.id,
@@ -201,6 +238,123 @@ def test_symmetric_mac(kid, alg, key_ops, base_iv, k, pl, algo, ct):
     assert key.verify_tag(ct, pl, algo)
 
 
+@m.parametrize("alg", [CoseAlgorithms.HMAC_256_64, CoseAlgorithms.HMAC_256_256, CoseAlgorithms.AES_MAC_128_64],
+               ids=["Tampered_tag_HMAC_256_64", "Tampered_tag_HMAC_256_256", "Tampered_tag_AES_CBC_128_64"])
+def test_symmetric_mac_tampered_tag(alg):
+    key = SymmetricKey(alg=alg, key_ops=KeyOps.MAC_CREATE, k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+
+    tag = key.compute_tag(b"This is the content.")
+    tampered = bytes([tag[0] ^ 0x01]) + tag[1:]
+
+    key.key_ops = KeyOps.MAC_VERIFY
+    with raises(CoseInvalidTag):
+        key.verify_tag(tampered, b"This is the content.")
+
+
+def test_symmetric_mac_truncated_tag_length():
+    k = unhexlify("849B57219DAE48DE646D07DBB533566E976686457C1491BE3A76DCEA6C427188")
+    full_tag = SymmetricKey(alg=CoseAlgorithms.HMAC_256_256, k=k).compute_tag(b"This is the content.")
+
+    key = SymmetricKey(alg=CoseAlgorithms.HMAC_256_64, key_ops=KeyOps.MAC_VERIFY, k=k)
+    assert key.verify_tag(full_tag[:8], b"This is the content.")
+
+    # only the truncated tag is valid, neither the full HMAC output nor a shorter prefix
+    for tag in [full_tag, full_tag[:7]]:
+        with raises(CoseInvalidTag):
+            key.verify_tag(tag, b"This is the content.")
+
+
+@m.parametrize("alg, key_ops, operation",
+               [(CoseAlgorithms.A128GCM, KeyOps.MAC_CREATE, lambda key: key.compute_tag(b"This is the content.")),
+                (CoseAlgorithms.HMAC_256_256, KeyOps.ENCRYPT,
+                 lambda key: key.encrypt(b"This is the content.", b"", unhexlify("02D1F7E6F26C43D4868D87CE"), None)),
+                (CoseAlgorithms.ES256, KeyOps.WRAP,
+                 lambda key: key.key_wrap(unhexlify("DDDC08972DF9BE62855291A17A1B4CF7")))],
+               ids=["Invalid_MAC_algorithm", "Invalid_AEAD_algorithm", "Invalid_key_wrap_algorithm"])
+def test_symmetric_key_invalid_algorithm(alg, key_ops, operation):
+    key = SymmetricKey(alg=alg, key_ops=key_ops, k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+
+    with raises(CoseInvalidAlgorithm):
+        operation(key)
+
+
+@m.parametrize("alg", [CoseAlgorithms.HMAC_256_64, CoseAlgorithms.HMAC_512_512, CoseAlgorithms.AES_MAC_128_128],
+               ids=["MAC_session_HMAC_256_64", "MAC_session_HMAC_512_512", "MAC_session_AES_CBC_128_128"])
+def test_symmetric_mac_session(alg):
+    key = SymmetricKey(alg=alg, k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+    session = MacSession(key)
+
+    for pl in [b"", b"This is the content.", b"\x00" * 100]:
+        tag = session.compute_tag(pl)
+        assert tag == SymmetricKey(alg=alg, k=key.k).compute_tag(pl)
+        assert session.verify_tag(tag, pl)
+
+        with raises(CoseInvalidTag):
+            session.verify_tag(tag, pl + b"\x01")
+
+
+def test_symmetric_mac_session_key_ops():
+    key = SymmetricKey(alg=CoseAlgorithms.HMAC_256_256, key_ops=KeyOps.MAC_VERIFY,
+                       k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+    session = MacSession(key)
+
+    with raises(CoseIllegalKeyOps):
+        session.compute_tag(b"This is the content.")
+
+    key.key_ops = KeyOps.ENCRYPT
+    with raises(CoseIllegalKeyOps):
+        session.verify_tag(b"", b"This is the content.")
+
+
+def test_symmetric_cbc_mac_empty_payload():
+    key = SymmetricKey(alg=CoseAlgorithms.AES_MAC_128_128, k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+    session = MacSession(key)
+
+    tag = session.compute_tag(b"")
+    assert len(tag) == 16
+    assert tag == session.compute_tag(bytes(16))
+
+    with raises(CoseInvalidTag):
+        session.verify_tag(b"", b"")
+
+
+@m.parametrize("alg", [CoseAlgorithms.A128GCM, CoseAlgorithms.AES_CCM_16_64_128],
+               ids=["AEAD_session_A128GCM", "AEAD_session_AES_CCM_16_64_128"])
+def test_symmetric_aead_session(alg):
+    key = SymmetricKey(alg=alg, k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+    session = AEADSession(key)
+    nonce = unhexlify("89F52F65A1C580933B5261A72F")[:12 if alg == CoseAlgorithms.A128GCM else 13]
+
+    for pl in [b"", b"This is the content.", b"\x00" * 192]:
+        ct = session.encrypt(pl, b"aad", nonce)
+        assert ct == SymmetricKey(alg=alg, k=key.k).encrypt(pl, b"aad", nonce, alg)
+        assert session.decrypt(ct, b"aad", nonce) == pl
+
+        with raises(InvalidTag):
+            session.decrypt(ct, b"aad\x01", nonce)
+
+
+def test_symmetric_aead_session_invalid_algorithm():
+    with raises(CoseInvalidAlgorithm):
+        AEADSession(SymmetricKey(alg=CoseAlgorithms.HMAC_256_256, k=unhexlify("849B57219DAE48DE646D07DBB533566E")))
+
+
+def test_symmetric_aead_session_key_ops():
+    key = SymmetricKey(alg=CoseAlgorithms.A128GCM, key_ops=KeyOps.DECRYPT,
+                       k=unhexlify("849B57219DAE48DE646D07DBB533566E"))
+    session = AEADSession(key)
+    nonce = unhexlify("02D1F7E6F26C43D4868D87CE")
+
+    with raises(CoseIllegalKeyOps):
+        session.encrypt(b"This is the content.", b"", nonce)
+
+    key.key_ops = KeyOps.ENCRYPT
+    ct = session.encrypt(b"This is the content.", b"", nonce)
+
+    with raises(CoseIllegalKeyOps):
+        session.decrypt(ct, b"", nonce)
+
+
 @m.parametrize("kid, alg, key_ops, base_iv, k, salt, algo, ctx_alg, u, v, pub, priv, context, cek",
                [("our-secret".encode('utf-8'),
                  CoseAlgorithms.DIRECT_HKDF_SHA_256,
@@ -397,3 +551,39 @@ def test_ec_ecdsa(kid, alg, key_ops, x, y, d, curve, to_sign, signature):
     # switch key operation
     key.key_ops = KeyOps.VERIFY
     assert key.verify(to_be_signed=to_sign, signature=signature, alg=alg, curve=curve)
+
+
+def _es256_signing_key() -> EC2:
+    return EC2(
+        alg=CoseAlgorithms.ES256,
+        key_ops=KeyOps.SIGN,
+        x=CoseKey.base64decode("usWxHK2PmfnHKwXPS54m0kTcGJ90UiglWiGahtagnv8"),
+        y=CoseKey.base64decode("IBOL-C3BttVivg-lSreASjpkttcsz-1rb7btKLv8EX4"),
+        d=CoseKey.base64decode("V8kgd2ZBRuh2dgyVINBUqpPDr7BOMGcF22CQMIUHtNM"),
+        crv=EllipticCurveType.P_256
+    )
+
+
+def test_ec_ecdsa_tampered_signature():
+    key = _es256_signing_key()
+
+    signature = bytearray(key.sign(to_be_signed=b"This is the content."))
+    signature[-1] ^= 0x01
+
+    key.key_ops = KeyOps.VERIFY
+    with raises(InvalidSignature):
+        key.verify(to_be_signed=b"This is the content.", signature=bytes(signature))
+
+
+def test_ec_ecdsa_invalid_signature_length():
+    key = _es256_signing_key()
+
+    signature = key.sign(to_be_signed=b"This is the content.")
+    padded = b"\x00" * 32 + signature[:32] + b"\x00" * 32 + signature[32:]
+
+    key.key_ops = KeyOps.VERIFY
+    assert key.verify(to_be_signed=b"This is the content.", signature=signature)
+
+    for invalid in [padded, signature[:-1]]:
+        with raises(InvalidSignature):
+            key.verify(to_be_signed=b"This is the content.", signature=invalid)